@@ -10,18 +10,34 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from .dependency_checker import check_dependencies
+from .completion import SHELL_SCRIPTS, is_completion_cache_current, write_completion_cache
+from .dependency_checker import check_dependencies, check_docker_images, docker_image_from_args
+from .registry_sync import RegistrySyncError, load_registry_cache, sync_registry
 from .server_registry import (
+    MCP_SERVERS,
     get_config_path,
     get_installed_servers,
     get_mcp_config,
     get_server_info,
     search_servers,
 )
+from .warm_pool import (
+    DEFAULT_SOCKET_PATH,
+    Supervisor,
+    SupervisorStartError,
+    is_proxy_config,
+    make_proxy_config,
+    request_stats,
+    unwrap_proxy_config,
+)
 
 app = typer.Typer()
 config_app = typer.Typer()
 app.add_typer(config_app, name="config", help="Manage client configuration")
+pool_app = typer.Typer()
+app.add_typer(pool_app, name="pool", help="Manage the warm server pool")
+registry_app = typer.Typer()
+app.add_typer(registry_app, name="registry", help="Manage the server registry")
 
 console = Console()
 
@@ -32,6 +48,12 @@ class ClientType(str, Enum):
     CLAUDE_CODE = "claude-code"
 
 
+class ShellType(str, Enum):
+    BASH = "bash"
+    ZSH = "zsh"
+    FISH = "fish"
+
+
 # Define options at module level
 client_option = typer.Option(
     ClientType.CLAUDE_DESKTOP, help="Client type (cursor, claude-desktop, or claude-code)"
@@ -120,6 +142,14 @@ def install(
             console.print("\n[yellow]Please install the missing dependencies and try again.[/yellow]")
             return
 
+    if "Docker" in dependencies:
+        image = docker_image_from_args(server_info.mcp_config.args)
+        if image and check_docker_images([image]):
+            console.print(
+                f"[yellow]Docker image {image} is not pulled yet; "
+                "the first start will download it.[/yellow]"
+            )
+
     mcp_config = get_mcp_config(server_name)
     if not mcp_config:
         console.print(f"[red]No MCP configuration available for server:[/red] {server_name}")
@@ -163,6 +193,7 @@ def install(
             json.dump(config, f, indent=2)
 
         console.print(f"[green]Successfully installed[/green] {server_name} for {client.value}")
+        _refresh_completion_cache()
 
     except Exception as e:
         console.print(f"[red]Error updating {client.value} config:[/red] {str(e)}")
@@ -197,6 +228,7 @@ def uninstall(
             json.dump(config, f, indent=2)
 
         console.print(f"[green]Successfully removed[/green] {server_name} from {client.value} config")
+        _refresh_completion_cache()
 
     except Exception as e:
         console.print(f"[red]Error updating {client.value} config:[/red] {str(e)}")
@@ -242,6 +274,7 @@ def set_config_path(new_path: str, client: Optional[ClientType] = client_option)
         f.write(str(new_path))
 
     console.print(f"[green]Successfully set new {client.value} config path to:[/green] {new_path}")
+    _refresh_completion_cache()
 
 
 @app.command()
@@ -268,5 +301,185 @@ def list(client: Optional[ClientType] = client_option):
     console.print(table)
 
 
+def _refresh_completion_cache() -> None:
+    """
+    Rewrite the shell completion cache after the registry or a client config changes.
+    """
+    try:
+        write_completion_cache(
+            sorted(MCP_SERVERS), {client.value: get_config_path(client.value) for client in ClientType}
+        )
+    except OSError:
+        pass
+
+
+def _rewrite_server_configs(client: ClientType, rewrite) -> Optional[int]:
+    """
+    Apply `rewrite` to every server entry in the client config and return how many changed.
+    """
+    config_file = get_config_path(client)
+    if not config_file.exists():
+        console.print(f"[red]Config file not found at:[/red] {config_file}")
+        return None
+
+    try:
+        with open(config_file) as f:
+            config = json.load(f)
+
+        changed = 0
+        for name, mcp_config in config.get("mcpServers", {}).items():
+            new_config = rewrite(name, mcp_config)
+            if new_config != mcp_config:
+                config["mcpServers"][name] = new_config
+                changed += 1
+
+        with open(config_file, "w") as f:
+            json.dump(config, f, indent=2)
+
+    except Exception as e:
+        console.print(f"[red]Error updating {client.value} config:[/red] {str(e)}")
+        return None
+
+    _refresh_completion_cache()
+    return changed
+
+
+@pool_app.command("enable")
+def pool_enable(client: Optional[ClientType] = client_option):
+    """
+    Route installed servers through the warm pool.
+    """
+    # Only the servers `pool start` will pool; URL-based entries have no command to pre-spawn
+    pooled = {server["name"] for server in get_installed_servers(client)}
+
+    def enable(name: str, mcp_config: dict) -> dict:
+        if name not in pooled or "command" not in mcp_config or is_proxy_config(mcp_config):
+            return mcp_config
+        return make_proxy_config(name, mcp_config)
+
+    changed = _rewrite_server_configs(client, enable)
+    if changed is not None:
+        console.print(f"[green]Enabled warm pool for[/green] {changed} servers in {client.value} config")
+
+
+@pool_app.command("disable")
+def pool_disable(client: Optional[ClientType] = client_option):
+    """
+    Restore the original server entries in the client config.
+    """
+    changed = _rewrite_server_configs(client, lambda name, mcp_config: unwrap_proxy_config(mcp_config))
+    if changed is not None:
+        console.print(
+            f"[green]Disabled warm pool for[/green] {changed} servers in {client.value} config"
+        )
+
+
+@pool_app.command("start")
+def pool_start(
+    client: Optional[ClientType] = client_option,
+    size: int = typer.Option(1, min=1, help="Number of warm instances to keep per server"),
+):
+    """
+    Run the warm pool supervisor for the installed servers.
+    """
+    servers = {
+        server["name"]: unwrap_proxy_config(server["config"])
+        for server in get_installed_servers(client)
+        if "command" in server["config"]
+    }
+    if not servers:
+        console.print(f"[yellow]No MCP servers are currently installed for {client.value}.[/yellow]")
+        return
+
+    supervisor = Supervisor(servers, size=size)
+    try:
+        supervisor.start()
+    except SupervisorStartError as e:
+        console.print(f"[red]{str(e)}[/red]")
+        return
+    console.print(
+        f"[green]Warm pool running[/green] for {', '.join(servers)} ({size} per server) "
+        f"on {DEFAULT_SOCKET_PATH}"
+    )
+    try:
+        supervisor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
+
+
+@pool_app.command("stats")
+def pool_stats():
+    """
+    Show hit-rate and attach-latency metrics from the running warm pool.
+    """
+    stats = request_stats()
+    if stats is None:
+        console.print(f"[red]Warm pool is not running at:[/red] {DEFAULT_SOCKET_PATH}")
+        return
+
+    table = Table(title="Warm Pool", show_header=True, header_style="bold magenta")
+    table.add_column("Server", style="cyan")
+    table.add_column("Idle", justify="right")
+    table.add_column("Hits", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Hit Rate", justify="right")
+    table.add_column("Attach p50 (ms)", justify="right")
+    table.add_column("Attach max (ms)", justify="right")
+    table.add_column("Restarts", justify="right")
+
+    for name, server in stats.items():
+        table.add_row(
+            name,
+            str(server["idle"]),
+            str(server["hits"]),
+            str(server["misses"]),
+            f"{server['hit_rate']:.0%}",
+            f"{server['attach_ms']['p50']:.1f}",
+            f"{server['attach_ms']['max']:.1f}",
+            str(server["restarts"]),
+        )
+
+    console.print(table)
+
+
+@registry_app.command("sync")
+def registry_sync(
+    feed: str = typer.Option(
+        ...,
+        envvar="MCP_MANAGER_REGISTRY_URL",
+        help="Base URL of the registry feed (https:// or file://)",
+    ),
+):
+    """
+    Fetch registry changes since the last sync.
+    """
+    try:
+        result = sync_registry(feed)
+    except RegistrySyncError as e:
+        console.print(f"[red]Error syncing registry:[/red] {str(e)}")
+        return
+
+    mode = "full catalog" if result.full else "delta"
+    console.print(
+        f"[green]Registry synced to revision {result.revision}[/green] ({mode}): "
+        f"{len(result.added)} added, {len(result.changed)} changed, {len(result.removed)} removed"
+    )
+    _refresh_completion_cache()
+
+
+@app.command()
+def completion(shell: ShellType):
+    """
+    Print a shell completion script for server names and refresh its candidate cache.
+    """
+    _refresh_completion_cache()
+    print(SHELL_SCRIPTS[shell.value], end="")
+
+
 def main():
+    load_registry_cache()
+    if not is_completion_cache_current(sorted(MCP_SERVERS)):
+        _refresh_completion_cache()
     app()
@@ -0,0 +1,207 @@
+"""
+Fast shell completion for commands and server names.
+
+Shells run the `mcp-manager-complete` entry point on every TAB press, so this module only depends
+on the standard library and never imports typer, rich, pydantic or the registry. Candidates are
+served from a small cache file that the CLI rewrites whenever the registry or a client config
+changes, including when a package upgrade changes the built-in registry. Installed names are read
+from a client config on first use and again whenever its modification time no longer matches the
+one recorded in the cache, so edits made outside the CLI are picked up too.
+"""
+
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+COMPLETION_CACHE_PATH = os.path.expanduser("~/.mcp_manager_completion.json")
+DEFAULT_CLIENT = "claude-desktop"
+CLIENTS = ["claude-code", "claude-desktop", "cursor"]
+
+# Top-level commands and their subcommands
+COMMANDS: Dict[str, List[str]] = {
+    "search": [],
+    "info": [],
+    "install": [],
+    "uninstall": [],
+    "list": [],
+    "config": ["path", "set-path"],
+    "pool": ["enable", "disable", "start", "stats"],
+    "registry": ["sync"],
+    "completion": ["bash", "zsh", "fish"],
+}
+SERVER_COMMANDS = ["info", "install"]
+INSTALLED_COMMANDS = ["uninstall"]
+
+SHELL_SCRIPTS = {
+    "bash": """_mcp_manager_complete() {
+    local IFS=$'\\n'
+    COMPREPLY=($(mcp-manager-complete "${COMP_WORDS[@]:1:$COMP_CWORD}"))
+}
+complete -o default -F _mcp_manager_complete mcp-manager
+""",
+    "zsh": """#compdef mcp-manager
+_mcp_manager() {
+    local -a candidates
+    candidates=(${(f)"$(mcp-manager-complete "${(@)words[2,CURRENT]}")"})
+    compadd -a candidates
+}
+compdef _mcp_manager mcp-manager
+""",
+    "fish": """function __mcp_manager_complete
+    mcp-manager-complete (commandline -opc)[2..-1] (commandline -ct | string collect -a)
+end
+complete -c mcp-manager -f -a '(__mcp_manager_complete)'
+""",
+}
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _read_installed(config_path: str) -> List[str]:
+    try:
+        with open(config_path) as f:
+            return [*json.load(f).get("mcpServers", {})]
+    except (OSError, ValueError, AttributeError):
+        return []
+
+
+def _write_cache(cache: Dict, cache_path: str) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, cache_path)
+
+
+def write_completion_cache(
+    servers: List[str], config_paths: Dict[str, str], cache_path: str = COMPLETION_CACHE_PATH
+) -> None:
+    """
+    Precompute completion candidates.
+
+    Args:
+        servers: Names of all servers in the registry
+        config_paths: Config file path for each client
+        cache_path: Path of the completion cache file
+    """
+    # Installed names are filled in by the first completion that needs them
+    clients = {
+        client: {"path": str(path), "mtime": None, "installed": []}
+        for client, path in config_paths.items()
+    }
+    _write_cache({"servers": servers, "clients": clients}, cache_path)
+
+
+def load_completion_cache(cache_path: str = COMPLETION_CACHE_PATH) -> Dict:
+    """
+    Read the completion cache, returning an empty cache if it is missing or corrupt.
+    """
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def is_completion_cache_current(servers: List[str], cache_path: str = COMPLETION_CACHE_PATH) -> bool:
+    """
+    Check whether the cached server names match the registry, e.g. after a package upgrade.
+
+    Args:
+        servers: Names of all servers in the registry
+        cache_path: Path of the completion cache file
+    """
+    return load_completion_cache(cache_path).get("servers") == servers
+
+
+def _installed_names(cache: Dict, client: str, cache_path: str) -> List[str]:
+    entry = cache.get("clients", {}).get(client)
+    if not entry:
+        return []
+
+    mtime = _mtime(entry["path"])
+    if mtime is None:
+        return []
+    if mtime != entry["mtime"]:
+        entry["mtime"] = mtime
+        entry["installed"] = _read_installed(entry["path"])
+        try:
+            _write_cache(cache, cache_path)
+        except OSError:
+            pass
+    return entry["installed"]
+
+
+def _join_option_values(words: List[str]) -> List[str]:
+    # bash splits `--client=cursor` into `--client`, `=`, `cursor`
+    joined: List[str] = []
+    for word in words:
+        if joined and (word == "=" or joined[-1].endswith("=")) and joined[-1].startswith("-"):
+            joined[-1] += word
+        else:
+            joined.append(word)
+    return joined
+
+
+def complete(words: List[str], cache_path: str = COMPLETION_CACHE_PATH) -> List[str]:
+    """
+    Complete a command line.
+
+    Args:
+        words: Words after `mcp-manager`, ending with the (possibly empty) word being completed
+        cache_path: Path of the completion cache file
+
+    Returns:
+        Sorted candidates for the last word
+    """
+    prefix = words[-1] if words else ""
+    preceding = _join_option_values(words[:-1])
+
+    if preceding and preceding[-1] in ("--client", "--client="):
+        return [client for client in CLIENTS if client.startswith(prefix)]
+    if prefix.startswith("--client="):
+        return [f"--client={client}" for client in CLIENTS if f"--client={client}".startswith(prefix)]
+    if prefix.startswith("-"):
+        return []
+
+    client = DEFAULT_CLIENT
+    positional = []
+    remaining = iter(preceding)
+    for word in remaining:
+        if word == "--client":
+            client = next(remaining, client)
+        elif word.startswith("--client="):
+            client = word[len("--client=") :]
+        elif not word.startswith("-"):
+            positional.append(word)
+
+    if not positional:
+        candidates = [*COMMANDS]
+    elif len(positional) > 1:
+        candidates = []
+    elif COMMANDS.get(positional[0]):
+        candidates = COMMANDS[positional[0]]
+    elif positional[0] in SERVER_COMMANDS:
+        candidates = load_completion_cache(cache_path).get("servers", [])
+    elif positional[0] in INSTALLED_COMMANDS:
+        candidates = _installed_names(load_completion_cache(cache_path), client, cache_path)
+    else:
+        candidates = []
+
+    return sorted(candidate for candidate in candidates if candidate.startswith(prefix))
+
+
+def main() -> None:
+    candidates = complete(sys.argv[1:])
+    if candidates:
+        print("\n".join(candidates))
+
+
+if __name__ == "__main__":
+    main()
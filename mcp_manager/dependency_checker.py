@@ -1,8 +1,242 @@
 """Module for checking if required dependencies are installed."""
 
+import http.client
+import json
+import os
 import shutil
+import socket
 import subprocess
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+DOCKER_SOCKET_PATH = "/var/run/docker.sock"
+DOCKER_PROBE_TIMEOUT = 0.5
+
+# `docker run` options that consume the following argument as their value
+DOCKER_RUN_VALUE_OPTIONS = {
+    "-a",
+    "--add-host",
+    "--attach",
+    "--blkio-weight",
+    "-c",
+    "--cap-add",
+    "--cap-drop",
+    "--cgroup-parent",
+    "--cgroupns",
+    "--cidfile",
+    "--cpu-period",
+    "--cpu-quota",
+    "--cpu-shares",
+    "--cpus",
+    "--cpuset-cpus",
+    "--cpuset-mems",
+    "--detach-keys",
+    "--device",
+    "--device-cgroup-rule",
+    "--dns",
+    "--dns-option",
+    "--dns-search",
+    "--domainname",
+    "-e",
+    "--entrypoint",
+    "--env",
+    "--env-file",
+    "--expose",
+    "--gpus",
+    "--group-add",
+    "-h",
+    "--health-cmd",
+    "--health-interval",
+    "--health-retries",
+    "--health-start-period",
+    "--health-timeout",
+    "--hostname",
+    "--ip",
+    "--ip6",
+    "--ipc",
+    "--isolation",
+    "-l",
+    "--label",
+    "--label-file",
+    "--link",
+    "--log-driver",
+    "--log-opt",
+    "-m",
+    "--mac-address",
+    "--memory",
+    "--memory-reservation",
+    "--memory-swap",
+    "--memory-swappiness",
+    "--mount",
+    "--name",
+    "--network",
+    "--network-alias",
+    "--oom-score-adj",
+    "-p",
+    "--pid",
+    "--pids-limit",
+    "--platform",
+    "--publish",
+    "--pull",
+    "--restart",
+    "--runtime",
+    "--security-opt",
+    "--shm-size",
+    "--stop-signal",
+    "--stop-timeout",
+    "--storage-opt",
+    "--sysctl",
+    "--tmpfs",
+    "-u",
+    "--ulimit",
+    "--user",
+    "--userns",
+    "--uts",
+    "-v",
+    "--volume",
+    "--volume-driver",
+    "--volumes-from",
+    "-w",
+    "--workdir",
+}
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def _docker_connection(timeout: float) -> Optional[http.client.HTTPConnection]:
+    """
+    Open a connection to the Docker Engine API from `DOCKER_HOST` or the default socket.
+
+    Returns:
+        Connection, or None if the daemon can't be probed directly (e.g. TLS or SSH hosts)
+    """
+    host = os.environ.get("DOCKER_HOST") or f"unix://{DOCKER_SOCKET_PATH}"
+    if host.startswith("unix://"):
+        socket_path = host[len("unix://") :]
+        if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+            return None
+        return _UnixHTTPConnection(socket_path, timeout)
+    if host.startswith("tcp://") and not os.environ.get("DOCKER_TLS_VERIFY"):
+        address = urlsplit(host)
+        return http.client.HTTPConnection(address.hostname, address.port or 2375, timeout=timeout)
+    return None
+
+
+def _docker_get(path: str, timeout: float) -> Optional[Tuple[int, bytes]]:
+    """
+    Send a GET request to the Docker Engine API.
+
+    Returns:
+        Tuple of (status: int, body: bytes), or None if the daemon can't be probed directly
+
+    Raises:
+        OSError or http.client.HTTPException if the daemon is unreachable
+    """
+    conn = _docker_connection(timeout)
+    if conn is None:
+        return None
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        return response.status, response.read()
+    finally:
+        conn.close()
+
+
+def ping_docker_daemon(timeout: float = DOCKER_PROBE_TIMEOUT) -> Optional[bool]:
+    """
+    Check if the Docker daemon is running with a `/_ping` request on its socket.
+
+    This avoids forking the `docker` CLI and gathering full daemon state with `docker info`.
+
+    Args:
+        timeout: Seconds to wait for the daemon to answer
+
+    Returns:
+        True if the daemon answered, False if it is unreachable, None if it can't be probed directly
+    """
+    try:
+        result = _docker_get("/_ping", timeout)
+    except (OSError, http.client.HTTPException):
+        return False
+    if result is None:
+        return None
+    status, body = result
+    return status == 200 and body.strip() == b"OK"
+
+
+def docker_image_from_args(args: List[str]) -> Optional[str]:
+    """
+    Find the image referenced by `docker run` arguments.
+
+    Args:
+        args: MCP config args, e.g. ["run", "-i", "--rm", "mcp/fetch"]
+
+    Returns:
+        Image reference if found, None otherwise
+    """
+    if "run" not in args:
+        return None
+    remaining = iter(args[args.index("run") + 1 :])
+    for arg in remaining:
+        if arg in DOCKER_RUN_VALUE_OPTIONS:
+            next(remaining, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _with_default_tag(image: str) -> str:
+    name = image.rsplit("/", 1)[-1]
+    if ":" in name or "@" in name:
+        return image
+    return f"{image}:latest"
+
+
+def check_docker_images(images: List[str], timeout: float = DOCKER_PROBE_TIMEOUT) -> Optional[List[str]]:
+    """
+    Check which Docker images are not present locally, in a single request to the daemon.
+
+    Args:
+        images: Image references, e.g. ["mcp/fetch", "ghcr.io/github/github-mcp-server"]
+        timeout: Seconds to wait for the daemon to answer
+
+    Returns:
+        List of missing images, or None if the daemon can't be queried
+    """
+    filters = quote(json.dumps({"reference": images}))
+    try:
+        result = _docker_get(f"/images/json?filters={filters}", timeout)
+    except (OSError, http.client.HTTPException):
+        return None
+    if result is None or result[0] != 200:
+        return None
+
+    try:
+        present = set()
+        for image in json.loads(result[1]):
+            present.update(image.get("RepoTags") or [])
+            present.update(image.get("RepoDigests") or [])
+    except (ValueError, AttributeError):
+        return None
+
+    return [image for image in images if _with_default_tag(image) not in present]
 
 
 def check_nodejs_npm() -> Tuple[bool, List[str]]:
@@ -39,10 +273,16 @@ def check_docker() -> Tuple[bool, List[str]]:
         missing.append("Docker")
         return False, missing
 
-    # Check if docker daemon is running
-    try:
-        subprocess.run(["docker", "info"], capture_output=True, check=True)
-    except subprocess.CalledProcessError:
+    # Check if docker daemon is running. Only a successful ping skips the CLI: a refused, denied or
+    # slow socket may still mean a running daemon behind another docker context.
+    running = ping_docker_daemon()
+    if not running:
+        try:
+            subprocess.run(["docker", "info"], capture_output=True, check=True)
+            running = True
+        except subprocess.CalledProcessError:
+            running = False
+    if not running:
         missing.append("Docker daemon (not running)")
 
     return len(missing) == 0, missing
@@ -0,0 +1,258 @@
+"""
+Incremental sync of the server registry from a remote catalog feed.
+
+A feed is a base URL (`https://`, `http://` or `file://`) that serves:
+- head.json: {"revision": N}, the latest revision
+- catalog.json: {"revision": N, "servers": {name: MCPServer}}
+- deltas/<revision>.json: the changes from <revision> to a later revision,
+  {"base_revision": R, "revision": N, "added": {...}, "changed": {...}, "removed": [names]}
+
+The client compares its revision with head.json, so an up-to-date client downloads only that
+small document. A stale client follows deltas from its revision until it reaches the head. If
+a delta is missing or doesn't start from the local revision, or the head is behind the local
+revision because the feed was reset, the client falls back to the full catalog.
+
+Feed records are layered on top of the built-in servers. A feed can override a built-in server,
+and removing that record from the feed restores the built-in entry.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.request import urlopen
+
+from pydantic import BaseModel, Field, ValidationError
+
+from .server_registry import (
+    BUILTIN_SERVERS,
+    MCP_SERVERS,
+    MCPServer,
+    apply_registry_changes,
+    replace_registry,
+)
+
+REGISTRY_CACHE_PATH = Path(os.path.expanduser("~/.mcp_manager_registry.json"))
+FEED_TIMEOUT = 10.0
+
+
+class RegistrySyncError(Exception):
+    """Raised when the registry feed can't be read or is malformed."""
+
+
+class CatalogHead(BaseModel):
+    revision: int
+
+
+class CatalogDelta(BaseModel):
+    base_revision: int
+    revision: int
+    added: Dict[str, MCPServer] = Field(default_factory=dict)
+    changed: Dict[str, MCPServer] = Field(default_factory=dict)
+    removed: List[str] = Field(default_factory=list)
+
+
+class Catalog(BaseModel):
+    revision: int
+    servers: Dict[str, MCPServer]
+
+
+class SyncResult(BaseModel):
+    revision: int
+    full: bool
+    added: List[str] = Field(default_factory=list)
+    changed: List[str] = Field(default_factory=list)
+    removed: List[str] = Field(default_factory=list)
+
+
+def _fetch_json(url: str) -> Optional[Dict]:
+    """
+    Fetch and decode a JSON document from the feed.
+
+    Returns:
+        The decoded document, or None if it isn't published
+
+    Raises:
+        RegistrySyncError: If the feed can't be reached or the document isn't valid JSON
+    """
+    try:
+        with urlopen(url, timeout=FEED_TIMEOUT) as response:
+            return json.load(response)
+    except HTTPError as e:
+        if e.code == 404:
+            return None
+        raise RegistrySyncError(f"Error fetching {url}: {e}") from e
+    except URLError as e:
+        if isinstance(e.reason, FileNotFoundError):
+            return None
+        raise RegistrySyncError(f"Error fetching {url}: {e.reason}") from e
+    except (OSError, ValueError) as e:
+        raise RegistrySyncError(f"Error fetching {url}: {e}") from e
+
+
+def _fetch_model(url: str, model):
+    document = _fetch_json(url)
+    if document is None:
+        return None
+    try:
+        return model.model_validate(document)
+    except ValidationError as e:
+        raise RegistrySyncError(f"Invalid document at {url}: {e}") from e
+
+
+def _read_registry_cache(cache_path: Path) -> Tuple[int, Dict[str, MCPServer]]:
+    if not cache_path.exists():
+        return 0, {}
+    try:
+        with cache_path.open() as f:
+            catalog = Catalog.model_validate(json.load(f))
+    except (OSError, ValueError):
+        return 0, {}
+    return catalog.revision, catalog.servers
+
+
+def _save_registry_cache(revision: int, feed: Dict[str, MCPServer], cache_path: Path) -> None:
+    catalog = {
+        "revision": revision,
+        "servers": {name: info.model_dump(exclude_none=True) for name, info in feed.items()},
+    }
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with tmp_path.open("w") as f:
+        json.dump(catalog, f, indent=2)
+    os.replace(tmp_path, cache_path)
+
+
+def load_registry_cache(cache_path: Path = REGISTRY_CACHE_PATH) -> int:
+    """
+    Layer the last synced catalog on top of the built-in servers.
+
+    Args:
+        cache_path: Path of the local catalog store
+
+    Returns:
+        The cached catalog revision, or 0 if nothing has been synced
+    """
+    revision, feed = _read_registry_cache(cache_path)
+    replace_registry({**BUILTIN_SERVERS, **feed})
+    return revision
+
+
+def _apply_delta(feed: Dict[str, MCPServer], delta: CatalogDelta, result: SyncResult) -> None:
+    """
+    Patch the feed records, the registry and the running summary with one delta.
+    """
+    upserts = {**delta.added, **delta.changed}
+    removed = [name for name in delta.removed if name not in upserts]
+    for name in removed:
+        feed.pop(name, None)
+    feed.update(upserts)
+
+    restored = {name: BUILTIN_SERVERS[name] for name in removed if name in BUILTIN_SERVERS}
+    apply_registry_changes({**upserts, **restored}, [name for name in removed if name not in restored])
+
+    for name in delta.added:
+        if name in result.removed:
+            result.removed.remove(name)
+            result.changed.append(name)
+        elif name not in result.added:
+            result.added.append(name)
+    for name in delta.changed:
+        if name not in result.added and name not in result.changed:
+            result.changed.append(name)
+    for name in removed:
+        if name in result.added:
+            result.added.remove(name)
+            continue
+        if name in result.changed:
+            result.changed.remove(name)
+        result.removed.append(name)
+
+
+def _sync_deltas(
+    feed_url: str, revision: int, head_revision: Optional[int], feed: Dict[str, MCPServer]
+) -> Optional[SyncResult]:
+    """
+    Follow deltas from `revision` to the head of the feed.
+
+    Returns:
+        Summary of what changed, or None if there is a revision gap
+    """
+    result = SyncResult(revision=revision, full=False)
+    while head_revision is None or result.revision < head_revision:
+        delta = _fetch_model(f"{feed_url}/deltas/{result.revision}.json", CatalogDelta)
+        if delta is None:
+            # Without a head document, running out of deltas after applying some means we're current
+            if head_revision is None and result.revision != revision:
+                return result
+            return None
+        if delta.base_revision != result.revision:
+            return None
+        if delta.revision <= delta.base_revision:
+            raise RegistrySyncError(
+                f"Invalid delta for revision {delta.base_revision}: "
+                f"revision {delta.revision} does not move forward"
+            )
+        _apply_delta(feed, delta, result)
+        result.revision = delta.revision
+    return result
+
+
+def _sync_full(feed_url: str, previous: Dict[str, MCPServer]) -> Tuple[SyncResult, Dict[str, MCPServer]]:
+    """
+    Replace the feed records with the full catalog.
+
+    Args:
+        feed_url: Base URL of the feed
+        previous: The registry before this sync, which the summary is computed against
+    """
+    catalog = _fetch_model(f"{feed_url}/catalog.json", Catalog)
+    if catalog is None:
+        raise RegistrySyncError(f"No catalog published at {feed_url}")
+
+    replace_registry({**BUILTIN_SERVERS, **catalog.servers})
+    result = SyncResult(
+        revision=catalog.revision,
+        full=True,
+        added=[name for name in MCP_SERVERS if name not in previous],
+        changed=[
+            name for name, info in MCP_SERVERS.items() if name in previous and previous[name] != info
+        ],
+        removed=[name for name in previous if name not in MCP_SERVERS],
+    )
+    return result, catalog.servers
+
+
+def sync_registry(feed_url: str, cache_path: Path = REGISTRY_CACHE_PATH) -> SyncResult:
+    """
+    Bring the registry up to date with a catalog feed.
+
+    Args:
+        feed_url: Base URL of the feed
+        cache_path: Path of the local catalog store
+
+    Returns:
+        Summary of what changed
+
+    Raises:
+        RegistrySyncError: If the feed can't be read or is malformed
+    """
+    feed_url = feed_url.rstrip("/")
+    revision, feed = _read_registry_cache(cache_path)
+    replace_registry({**BUILTIN_SERVERS, **feed})
+    # Deltas patch the registry in place, so keep the starting state for a full-resync summary
+    previous = dict(MCP_SERVERS)
+
+    head = _fetch_model(f"{feed_url}/head.json", CatalogHead)
+    head_revision = head.revision if head is not None else None
+    if revision and head_revision == revision:
+        return SyncResult(revision=revision, full=False)
+
+    result = None
+    if revision and (head_revision is None or head_revision > revision):
+        result = _sync_deltas(feed_url, revision, head_revision, feed)
+    if result is None:
+        result, feed = _sync_full(feed_url, previous)
+
+    _save_registry_cache(result.revision, feed, cache_path)
+    return result
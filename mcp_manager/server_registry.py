@@ -11,7 +11,7 @@ Each server entry contains:
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -130,6 +130,46 @@ MCP_SERVERS: Dict[str, MCPServer] = {
 }
 
 
+# The servers shipped with the package; synced registry feeds are layered on top of these
+BUILTIN_SERVERS: Dict[str, MCPServer] = dict(MCP_SERVERS)
+
+# Lowercased "name\0description" per server, so searches don't re-normalize every entry
+_SEARCH_INDEX: Dict[str, str] = {}
+
+
+def _index_text(name: str, info: MCPServer) -> str:
+    return f"{name.lower()}\0{info.description.lower()}"
+
+
+def apply_registry_changes(upserts: Dict[str, MCPServer], removed: Iterable[str] = ()) -> None:
+    """
+    Patch the registry and its search index in place.
+
+    Args:
+        upserts: Servers to add or replace, keyed by name
+        removed: Names of servers to remove
+    """
+    for name in removed:
+        MCP_SERVERS.pop(name, None)
+        _SEARCH_INDEX.pop(name, None)
+    for name, info in upserts.items():
+        MCP_SERVERS[name] = info
+        _SEARCH_INDEX[name] = _index_text(name, info)
+
+
+def replace_registry(servers: Dict[str, MCPServer]) -> None:
+    """
+    Replace the whole registry and rebuild its search index.
+
+    Args:
+        servers: The complete set of servers, keyed by name
+    """
+    apply_registry_changes(servers, removed=[name for name in MCP_SERVERS if name not in servers])
+
+
+apply_registry_changes(dict(MCP_SERVERS))
+
+
 def get_server_info(server_name: str) -> Optional[MCPServer]:
     """
     Get information about a specific server.
@@ -154,13 +194,7 @@ def search_servers(keyword: str) -> List[str]:
         List of matching server names
     """
     keyword = keyword.lower()
-    matches = []
-
-    for name, info in MCP_SERVERS.items():
-        if keyword in name.lower() or keyword in info.description.lower():
-            matches.append(name)
-
-    return matches
+    return [name for name, text in _SEARCH_INDEX.items() if keyword in text]
 
 
 def get_mcp_config(server_name: str) -> Optional[Dict]:
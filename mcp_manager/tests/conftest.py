@@ -0,0 +1,11 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def socket_dir():
+    # Unix socket paths are limited to ~100 characters, so avoid pytest's long tmp_path
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
@@ -0,0 +1,164 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mcp_manager.cli import app, main
+from mcp_manager.completion import (
+    COMMANDS,
+    SHELL_SCRIPTS,
+    complete,
+    is_completion_cache_current,
+    write_completion_cache,
+)
+from mcp_manager.server_registry import MCP_SERVERS
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+# Run each shell's completion function for `mcp-manager install <TAB>`, with the script path as
+# the first positional argument
+SHELL_DRIVERS = {
+    "bash": [
+        "bash",
+        "-c",
+        'source "$1"; COMP_WORDS=(mcp-manager install ""); COMP_CWORD=2; '
+        '_mcp_manager_complete; printf "%s\\n" "${COMPREPLY[@]}"',
+        "bash",
+    ],
+    "zsh": [
+        "zsh",
+        "-fc",
+        'compdef() { :; }; compadd() { print -rl -- "${candidates[@]}"; }; source "$1"; '
+        'words=(mcp-manager install ""); CURRENT=3; _mcp_manager',
+        "zsh",
+    ],
+    "fish": ["fish", "-c", "source $argv[1]; complete -C 'mcp-manager install '"],
+}
+
+
+@pytest.fixture
+def claude_config(tmp_path: Path) -> Path:
+    config = tmp_path / "claude_desktop_config.json"
+    config.write_text(json.dumps({"mcpServers": {"fetch": {}, "git": {}}}))
+    return config
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path, claude_config: Path) -> str:
+    cache_path = str(tmp_path / "completion.json")
+    write_completion_cache(
+        sorted(MCP_SERVERS),
+        {"claude-desktop": str(claude_config), "cursor": str(tmp_path / "missing.json")},
+        cache_path,
+    )
+    return cache_path
+
+
+def test_complete_commands(cache_path: str) -> None:
+    """Test completing top-level commands and subcommands"""
+    assert complete(["in"], cache_path) == ["info", "install"]
+    assert complete(["pool", ""], cache_path) == ["disable", "enable", "start", "stats"]
+
+
+def test_complete_server_names(cache_path: str) -> None:
+    """Test completing registry server names"""
+    assert complete(["install", ""], cache_path) == sorted(MCP_SERVERS)
+    assert complete(["install", "f"], cache_path) == ["fetch", "filesystem"]
+    assert complete(["install", "fetch", ""], cache_path) == []
+
+
+def test_complete_installed_names(cache_path: str, claude_config: Path) -> None:
+    """Test completing installed names, including config edits made outside the CLI"""
+    assert complete(["uninstall", ""], cache_path) == ["fetch", "git"]
+    assert complete(["uninstall", "--client", "cursor", ""], cache_path) == []
+
+    claude_config.write_text(json.dumps({"mcpServers": {"memory": {}}}))
+    os.utime(claude_config, (time.time() + 10, time.time() + 10))
+    assert complete(["uninstall", ""], cache_path) == ["memory"]
+
+
+def test_complete_client_option(cache_path: str) -> None:
+    """Test completing --client values, including bash's split of `--client=`"""
+    assert complete(["install", "--client", "c"], cache_path) == [
+        "claude-code",
+        "claude-desktop",
+        "cursor",
+    ]
+    assert complete(["uninstall", "--client", "=", "cu"], cache_path) == ["cursor"]
+    assert complete(["uninstall", "--client=cu"], cache_path) == ["--client=cursor"]
+
+
+def test_stale_server_names_are_refreshed(cache_path: str, tmp_path: Path) -> None:
+    """Test that main() rewrites the cache when the registry no longer matches it"""
+    assert is_completion_cache_current(sorted(MCP_SERVERS), cache_path)
+    assert not is_completion_cache_current([*sorted(MCP_SERVERS), "weather"], cache_path)
+    assert not is_completion_cache_current(sorted(MCP_SERVERS), str(tmp_path / "missing.json"))
+
+    with patch("mcp_manager.cli.app"), patch("mcp_manager.cli.load_registry_cache"):
+        with patch("mcp_manager.cli.is_completion_cache_current", return_value=False):
+            with patch("mcp_manager.cli._refresh_completion_cache") as mock_refresh:
+                main()
+    mock_refresh.assert_called_once()
+
+
+@pytest.mark.parametrize("shell", sorted(SHELL_SCRIPTS))
+def test_shell_script_arguments(shell: str, tmp_path: Path) -> None:
+    """Test that each shell script passes the words after `mcp-manager`, including an empty last word"""
+    if shutil.which(shell) is None:
+        pytest.skip(f"{shell} is not installed")
+
+    # Stand-in for the entry point that echoes its arguments back as the only candidate
+    shim = tmp_path / "mcp-manager-complete"
+    shim.write_text(f"#!{sys.executable}\nimport json, sys\nprint(json.dumps(sys.argv[1:]))\n")
+    shim.chmod(0o755)
+    script = tmp_path / f"completion.{shell}"
+    script.write_text(SHELL_SCRIPTS[shell])
+
+    result = subprocess.run(
+        [*SHELL_DRIVERS[shell], str(script)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PATH": f"{tmp_path}{os.pathsep}{os.environ['PATH']}"},
+        check=True,
+    )
+    assert json.loads(result.stdout) == ["install", ""]
+
+
+def test_commands_match_cli() -> None:
+    """Test that the completion command table matches the CLI"""
+    commands = {command.name or command.callback.__name__ for command in app.registered_commands}
+    groups = {group.name: group.typer_instance for group in app.registered_groups}
+    assert set(COMMANDS) == commands | set(groups)
+    for name, group in groups.items():
+        assert sorted(COMMANDS[name]) == sorted(command.name for command in group.registered_commands)
+
+
+def test_completion_latency(cache_path: str) -> None:
+    """Test that completion stays interactive and avoids the heavy CLI imports"""
+    start = time.perf_counter()
+    for _ in range(100):
+        complete(["uninstall", ""], cache_path)
+    assert (time.perf_counter() - start) / 100 < 0.005
+
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "from mcp_manager.completion import complete\n"
+        f"candidates = complete(['install', 'f'], {cache_path!r})\n"
+        "elapsed = time.perf_counter() - start\n"
+        "heavy = [m for m in ('typer', 'rich', 'pydantic') if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'candidates': candidates, 'heavy': heavy}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, cwd=PACKAGE_ROOT, check=True
+    )
+    measured = json.loads(result.stdout)
+    assert measured["candidates"] == ["fetch", "filesystem"]
+    assert measured["heavy"] == []
+    assert measured["elapsed"] < 0.05
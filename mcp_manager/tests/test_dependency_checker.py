@@ -0,0 +1,174 @@
+import json
+import socket
+import socketserver
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from mcp_manager.dependency_checker import (
+    check_docker,
+    check_docker_images,
+    docker_image_from_args,
+    ping_docker_daemon,
+)
+
+LOCAL_IMAGES = [
+    {"RepoTags": ["mcp/fetch:latest"], "RepoDigests": ["mcp/fetch@sha256:abc"]},
+    {"RepoTags": None, "RepoDigests": []},
+]
+
+
+class DockerStubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        url = urlsplit(self.path)
+        self.server.requests.append(self.path)
+        if url.path == "/_ping":
+            body = b"OK"
+        elif url.path == "/images/json":
+            references = json.loads(parse_qs(url.query)["filters"][0])["reference"]
+            assert isinstance(references, list)
+            body = json.dumps(LOCAL_IMAGES).encode()
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DockerStubServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str):
+        super().__init__(socket_path, DockerStubHandler)
+        self.requests = []
+
+
+@pytest.fixture
+def docker_stub(socket_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    socket_path = socket_dir / "docker.sock"
+    server = DockerStubServer(str(socket_path))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_path}")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_ping_docker_daemon_running(docker_stub: DockerStubServer) -> None:
+    """Test pinging a daemon that answers on its socket"""
+    assert ping_docker_daemon() is True
+    assert docker_stub.requests == ["/_ping"]
+
+
+def test_ping_docker_daemon_not_listening(socket_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test pinging a socket with no daemon behind it"""
+    socket_path = socket_dir / "docker.sock"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(socket_path))
+    sock.close()
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_path}")
+    assert ping_docker_daemon() is False
+
+
+def test_ping_docker_daemon_unprobeable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that hosts we can't probe directly are reported as unknown"""
+    monkeypatch.setenv("DOCKER_HOST", "unix:///nonexistent/docker.sock")
+    assert ping_docker_daemon() is None
+    monkeypatch.setenv("DOCKER_HOST", "ssh://user@remote")
+    assert ping_docker_daemon() is None
+
+
+@patch("subprocess.run")
+@patch("shutil.which")
+def test_check_docker_uses_socket(mock_which, mock_run, docker_stub: DockerStubServer) -> None:
+    """Test that check_docker doesn't fork `docker info` when the socket answers"""
+    mock_which.return_value = "/usr/bin/docker"
+    assert check_docker() == (True, [])
+    mock_run.assert_not_called()
+
+
+@patch("subprocess.run")
+@patch("shutil.which")
+def test_check_docker_falls_back_to_cli(mock_which, mock_run, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that check_docker falls back to `docker info` when the socket can't be probed"""
+    monkeypatch.setenv("DOCKER_HOST", "ssh://user@remote")
+    mock_which.return_value = "/usr/bin/docker"
+    assert check_docker() == (True, [])
+    mock_run.assert_called_once()
+
+
+@patch("subprocess.run")
+@patch("shutil.which")
+def test_check_docker_falls_back_to_cli_when_refused(
+    mock_which, mock_run, socket_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a refused socket is confirmed with `docker info`, e.g. for a stale socket"""
+    socket_path = socket_dir / "docker.sock"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(socket_path))
+    sock.close()
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_path}")
+    mock_which.return_value = "/usr/bin/docker"
+
+    assert check_docker() == (True, [])
+    mock_run.assert_called_once()
+
+    mock_run.side_effect = subprocess.CalledProcessError(1, ["docker", "info"])
+    assert check_docker() == (False, ["Docker daemon (not running)"])
+
+
+def test_check_docker_images(docker_stub: DockerStubServer) -> None:
+    """Test finding missing images in a single request"""
+    missing = check_docker_images(["mcp/fetch", "ghcr.io/github/github-mcp-server"])
+    assert missing == ["ghcr.io/github/github-mcp-server"]
+    assert len(docker_stub.requests) == 1
+
+
+def test_docker_image_from_args() -> None:
+    """Test extracting the image from `docker run` arguments"""
+    assert docker_image_from_args(["run", "-i", "--rm", "mcp/fetch"]) == "mcp/fetch"
+    assert (
+        docker_image_from_args(["run", "-i", "-v", "claude-memory:/app/dist", "--rm", "mcp/memory"])
+        == "mcp/memory"
+    )
+    assert (
+        docker_image_from_args(
+            [
+                "run",
+                "-i",
+                "--rm",
+                "-e",
+                "GITHUB_PERSONAL_ACCESS_TOKEN",
+                "ghcr.io/github/github-mcp-server",
+            ]
+        )
+        == "ghcr.io/github/github-mcp-server"
+    )
+    assert (
+        docker_image_from_args(
+            [
+                "run",
+                "-i",
+                "--rm",
+                "--memory",
+                "512m",
+                "--pull",
+                "always",
+                "--cap-add",
+                "NET_ADMIN",
+                "mcp/fetch",
+            ]
+        )
+        == "mcp/fetch"
+    )
+    assert docker_image_from_args(["-y", "@modelcontextprotocol/server-filesystem"]) is None
@@ -0,0 +1,245 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mcp_manager.registry_sync import RegistrySyncError, load_registry_cache, sync_registry
+from mcp_manager.server_registry import (
+    BUILTIN_SERVERS,
+    MCP_SERVERS,
+    get_installed_servers,
+    get_server_info,
+    replace_registry,
+    search_servers,
+)
+
+
+def server_record(description: str) -> dict:
+    return {
+        "description": description,
+        "maintainer": "Example",
+        "mcp_config": {"command": "docker", "args": ["run", "-i", "--rm", "example/server"]},
+    }
+
+
+@pytest.fixture(autouse=True)
+def restore_registry():
+    servers = dict(MCP_SERVERS)
+    yield
+    replace_registry(servers)
+
+
+@pytest.fixture
+def feed(tmp_path: Path) -> Path:
+    feed = tmp_path / "feed"
+    (feed / "deltas").mkdir(parents=True)
+    return feed
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Path:
+    return tmp_path / "registry.json"
+
+
+def publish(feed: Path, path: str, document: dict) -> None:
+    (feed / path).write_text(json.dumps(document))
+
+
+def publish_catalog(feed: Path, revision: int, servers: dict) -> None:
+    publish(feed, "head.json", {"revision": revision})
+    publish(feed, "catalog.json", {"revision": revision, "servers": servers})
+
+
+def test_first_sync_downloads_full_catalog(feed: Path, cache_path: Path) -> None:
+    """Test that a client with no local revision fetches the full catalog on top of the built-ins"""
+    publish_catalog(feed, 1, {"weather": server_record("Forecasts")})
+
+    result = sync_registry(feed.as_uri(), cache_path)
+
+    assert result.full
+    assert result.revision == 1
+    assert (result.added, result.changed, result.removed) == (["weather"], [], [])
+    assert list(MCP_SERVERS) == [*BUILTIN_SERVERS, "weather"]
+    assert json.loads(cache_path.read_text())["servers"].keys() == {"weather"}
+
+
+def test_up_to_date_client_skips_catalog(feed: Path, cache_path: Path) -> None:
+    """Test that a current client only reads the head document"""
+    publish_catalog(feed, 1, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+    (feed / "catalog.json").unlink()
+
+    result = sync_registry(feed.as_uri(), cache_path)
+
+    assert not result.full
+    assert result.revision == 1
+    assert (result.added, result.changed, result.removed) == ([], [], [])
+    assert get_server_info("weather") is not None
+
+
+def test_delta_sync_patches_registry_and_index(feed: Path, cache_path: Path) -> None:
+    """Test that a delta adds, changes and removes records in place"""
+    publish_catalog(feed, 1, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+    (feed / "catalog.json").unlink()
+    publish(feed, "head.json", {"revision": 3})
+    publish(
+        feed,
+        "deltas/1.json",
+        {
+            "base_revision": 1,
+            "revision": 3,
+            "added": {"calendar": server_record("Calendar events")},
+            "changed": {"weather": server_record("Severe weather alerts")},
+            "removed": [],
+        },
+    )
+
+    result = sync_registry(feed.as_uri(), cache_path)
+
+    assert not result.full
+    assert result.revision == 3
+    assert (result.added, result.changed, result.removed) == (["calendar"], ["weather"], [])
+    assert get_server_info("weather").description == "Severe weather alerts"
+    assert search_servers("alerts") == ["weather"]
+    assert search_servers("forecasts") == []
+
+    publish(feed, "head.json", {"revision": 4})
+    publish(feed, "deltas/3.json", {"base_revision": 3, "revision": 4, "removed": ["calendar"]})
+    sync_registry(feed.as_uri(), cache_path)
+    assert search_servers("calendar") == []
+    assert get_server_info("calendar") is None
+
+
+def test_chained_deltas_reach_head_in_one_sync(feed: Path, cache_path: Path) -> None:
+    """Test that deltas published one revision at a time are followed to the head"""
+    publish_catalog(feed, 1, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+    (feed / "catalog.json").unlink()
+    publish(feed, "head.json", {"revision": 4})
+    publish(
+        feed,
+        "deltas/1.json",
+        {"base_revision": 1, "revision": 2, "added": {"maps": server_record("Maps")}},
+    )
+    publish(feed, "deltas/2.json", {"base_revision": 2, "revision": 3, "removed": ["maps"]})
+    publish(feed, "deltas/3.json", {"base_revision": 3, "revision": 4, "removed": ["weather"]})
+
+    result = sync_registry(feed.as_uri(), cache_path)
+
+    assert not result.full
+    assert result.revision == 4
+    assert (result.added, result.changed, result.removed) == ([], [], ["weather"])
+    assert list(MCP_SERVERS) == [*BUILTIN_SERVERS]
+
+
+def test_revision_gap_falls_back_to_full_sync(feed: Path, cache_path: Path) -> None:
+    """Test that a missing or mismatched delta triggers a full resync"""
+    publish_catalog(feed, 1, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+
+    publish(feed, "deltas/1.json", {"base_revision": 2, "revision": 5})
+    publish_catalog(feed, 5, {"maps": server_record("Maps")})
+
+    result = sync_registry(feed.as_uri(), cache_path)
+
+    assert result.full
+    assert (result.added, result.removed) == (["maps"], ["weather"])
+    assert list(MCP_SERVERS) == [*BUILTIN_SERVERS, "maps"]
+
+
+def test_gap_after_applied_delta_reports_against_starting_registry(feed: Path, cache_path: Path) -> None:
+    """Test that a full resync after a partial delta chain summarizes from the starting state"""
+    publish_catalog(feed, 1, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+
+    publish(
+        feed,
+        "deltas/1.json",
+        {"base_revision": 1, "revision": 2, "added": {"maps": server_record("Maps")}},
+    )
+    publish_catalog(
+        feed,
+        3,
+        {
+            "weather": server_record("Forecasts"),
+            "maps": server_record("Maps"),
+            "cal": server_record("Calendar"),
+        },
+    )
+
+    result = sync_registry(feed.as_uri(), cache_path)
+
+    assert result.full
+    assert result.revision == 3
+    assert (result.added, result.changed, result.removed) == (["maps", "cal"], [], [])
+    assert list(MCP_SERVERS) == [*BUILTIN_SERVERS, "weather", "maps", "cal"]
+
+
+def test_feed_reset_falls_back_to_full_sync(feed: Path, cache_path: Path) -> None:
+    """Test that a head behind the local revision triggers a full resync"""
+    publish_catalog(feed, 3, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+
+    publish_catalog(feed, 1, {"maps": server_record("Maps")})
+
+    result = sync_registry(feed.as_uri(), cache_path)
+
+    assert result.full
+    assert result.revision == 1
+    assert (result.added, result.removed) == (["maps"], ["weather"])
+    assert json.loads(cache_path.read_text())["revision"] == 1
+
+
+def test_delta_must_move_forward(feed: Path, cache_path: Path) -> None:
+    """Test that a delta that doesn't advance the revision is rejected"""
+    publish_catalog(feed, 1, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+    publish(feed, "head.json", {"revision": 2})
+    publish(feed, "deltas/1.json", {"base_revision": 1, "revision": 0})
+
+    with pytest.raises(RegistrySyncError):
+        sync_registry(feed.as_uri(), cache_path)
+    assert json.loads(cache_path.read_text())["revision"] == 1
+
+
+def test_feed_overrides_and_restores_builtin(feed: Path, cache_path: Path) -> None:
+    """Test that a feed can override a built-in server and removing it restores the built-in"""
+    publish_catalog(feed, 1, {"fetch": server_record("Fetch from the feed")})
+    sync_registry(feed.as_uri(), cache_path)
+    assert get_server_info("fetch").description == "Fetch from the feed"
+
+    publish(feed, "head.json", {"revision": 2})
+    publish(feed, "deltas/1.json", {"base_revision": 1, "revision": 2, "removed": ["fetch"]})
+    sync_registry(feed.as_uri(), cache_path)
+    assert get_server_info("fetch") == BUILTIN_SERVERS["fetch"]
+
+
+def test_installed_builtin_servers_survive_sync(feed: Path, cache_path: Path, tmp_path: Path) -> None:
+    """Test that installed built-in servers are still listed after syncing a feed"""
+    config = tmp_path / "claude_desktop_config.json"
+    config.write_text(json.dumps({"mcpServers": {"filesystem": {}, "weather": {}}}))
+    publish_catalog(feed, 1, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+
+    with patch("mcp_manager.server_registry.get_config_path", return_value=config):
+        installed = [server["name"] for server in get_installed_servers()]
+    assert installed == ["filesystem", "weather"]
+
+
+def test_load_registry_cache(feed: Path, cache_path: Path) -> None:
+    """Test that the synced catalog is restored from the local store"""
+    publish_catalog(feed, 2, {"weather": server_record("Forecasts")})
+    sync_registry(feed.as_uri(), cache_path)
+    replace_registry({})
+
+    assert load_registry_cache(cache_path) == 2
+    assert search_servers("forecast") == ["weather"]
+    assert get_server_info("filesystem") is not None
+
+
+def test_sync_without_catalog(feed: Path, cache_path: Path) -> None:
+    """Test that an empty feed is reported as an error"""
+    with pytest.raises(RegistrySyncError):
+        sync_registry(feed.as_uri(), cache_path)
@@ -0,0 +1,220 @@
+import json
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from mcp_manager.cli import app
+from mcp_manager.warm_pool import (
+    PoolMetrics,
+    ServerPool,
+    Supervisor,
+    SupervisorRunningError,
+    SupervisorStartError,
+    is_proxy_config,
+    make_proxy_config,
+    request_stats,
+    unwrap_proxy_config,
+)
+
+ECHO_SERVER = {
+    "command": sys.executable,
+    "args": [
+        "-c",
+        "import sys\nfor line in sys.stdin:\n    sys.stdout.write(line)\n    sys.stdout.flush()",
+    ],
+}
+
+
+def wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def supervisor(socket_dir: Path):
+    supervisor = Supervisor({"echo": ECHO_SERVER}, size=1, socket_path=str(socket_dir / "pool.sock"))
+    supervisor.start()
+    threading.Thread(target=supervisor.serve_forever, daemon=True).start()
+    yield supervisor
+    supervisor.stop()
+
+
+def attach(socket_path: str, server_name: str):
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(socket_path)
+    conn.sendall(json.dumps({"op": "attach", "server": server_name}).encode() + b"\n")
+    reader = conn.makefile("rb")
+    return conn, reader, json.loads(reader.readline())
+
+
+def test_proxy_config_round_trip() -> None:
+    """Test that a proxy entry keeps the original command, env and any other keys"""
+    original = {
+        "type": "stdio",
+        "command": "docker",
+        "args": ["run", "-i", "--rm", "mcp/fetch"],
+        "env": {"A": "1"},
+    }
+    proxy = make_proxy_config("fetch", original)
+    assert is_proxy_config(proxy)
+    assert not is_proxy_config(original)
+    assert proxy["env"] == {"A": "1"}
+    assert proxy["type"] == "stdio"
+    assert unwrap_proxy_config(proxy) == original
+    assert unwrap_proxy_config(original) is original
+
+
+def test_attach_hands_out_warm_instance(supervisor: Supervisor) -> None:
+    """Test that attaching to a filled pool is a hit and relays stdio"""
+    assert wait_for(lambda: supervisor.pools["echo"].idle_count == 1)
+
+    conn, reader, response = attach(supervisor.socket_path, "echo")
+    assert response == {"ok": True, "hit": True}
+    conn.sendall(b'{"jsonrpc": "2.0"}\n')
+    assert reader.readline() == b'{"jsonrpc": "2.0"}\n'
+    conn.close()
+
+    # The pool is replenished in the background
+    assert wait_for(lambda: supervisor.pools["echo"].idle_count == 1)
+    stats = request_stats(supervisor.socket_path)
+    assert stats["echo"]["hits"] == 1
+    assert stats["echo"]["hit_rate"] == 1.0
+    assert stats["echo"]["attach_ms"]["max"] > 0
+
+
+def test_attach_unknown_server(supervisor: Supervisor) -> None:
+    """Test that attaching to a server that is not pooled is rejected"""
+    conn, _, response = attach(supervisor.socket_path, "nonexistent")
+    conn.close()
+    assert response["ok"] is False
+
+
+def test_request_stats_without_supervisor(tmp_path: Path) -> None:
+    """Test that stats are unavailable when no supervisor is running"""
+    assert request_stats(str(tmp_path / "missing.sock")) is None
+
+
+def test_second_supervisor_refuses_to_start(supervisor: Supervisor) -> None:
+    """Test that a running supervisor's socket is not taken over"""
+    second = Supervisor({"echo": ECHO_SERVER}, socket_path=supervisor.socket_path)
+    with pytest.raises(SupervisorRunningError):
+        second.start()
+    second.stop()
+    assert request_stats(supervisor.socket_path) is not None
+
+
+def test_start_refuses_non_socket_path(socket_dir: Path) -> None:
+    """Test that a regular file at the socket path is left alone"""
+    socket_path = socket_dir / "pool.sock"
+    socket_path.write_text("not a socket")
+
+    supervisor = Supervisor({}, socket_path=str(socket_path))
+    with pytest.raises(SupervisorStartError):
+        supervisor.start()
+    assert socket_path.read_text() == "not a socket"
+
+
+def test_pool_enable_skips_unpoolable_entries(tmp_path: Path) -> None:
+    """Test that only installed registry servers with a command are proxied"""
+    fetch = {"type": "stdio", "command": "docker", "args": ["run", "-i", "--rm", "mcp/fetch"]}
+    servers = {
+        "fetch": fetch,
+        "github": {"type": "sse", "url": "https://example.com/sse"},
+        "custom": {"command": "custom-server", "args": []},
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"mcpServers": servers}))
+
+    runner = CliRunner()
+    with patch("mcp_manager.cli.get_config_path", return_value=config_file):
+        with patch("mcp_manager.server_registry.get_config_path", return_value=config_file):
+            with patch("mcp_manager.cli._refresh_completion_cache"):
+                result = runner.invoke(app, ["pool", "enable"])
+                assert result.exit_code == 0
+                assert "Enabled warm pool for 1 servers" in result.output
+                enabled = json.loads(config_file.read_text())["mcpServers"]
+                assert is_proxy_config(enabled["fetch"])
+                assert enabled["github"] == servers["github"]
+                assert enabled["custom"] == servers["custom"]
+
+                result = runner.invoke(app, ["pool", "disable"])
+                assert result.exit_code == 0
+                assert json.loads(config_file.read_text())["mcpServers"] == servers
+
+
+def test_stale_socket_is_replaced(socket_dir: Path) -> None:
+    """Test that a socket with no supervisor behind it is reused"""
+    socket_path = str(socket_dir / "pool.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    supervisor = Supervisor({}, socket_path=socket_path)
+    supervisor.start()
+    threading.Thread(target=supervisor.serve_forever, daemon=True).start()
+    try:
+        assert request_stats(socket_path) == {}
+    finally:
+        supervisor.stop()
+
+
+def test_stats_times_out_on_wedged_supervisor(socket_dir: Path) -> None:
+    """Test that a supervisor that never answers doesn't hang the client"""
+    socket_path = str(socket_dir / "pool.sock")
+    wedged = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    wedged.bind(socket_path)
+    wedged.listen()
+    try:
+        start = time.monotonic()
+        assert request_stats(socket_path) is None
+        assert time.monotonic() - start < 5
+    finally:
+        wedged.close()
+
+
+def test_crashing_server_backs_off() -> None:
+    """Test that instances that exit while idle are restarted with growing, capped delays"""
+    metrics = PoolMetrics()
+    pool = ServerPool(
+        "crash",
+        {"command": sys.executable, "args": ["-c", "pass"]},
+        size=1,
+        metrics=metrics,
+        backoff_base=0.1,
+        backoff_max=0.4,
+        check_interval=0.01,
+    )
+    spawned = []
+    spawn = pool.spawn
+
+    def record_spawn():
+        spawned.append(time.monotonic())
+        return spawn()
+
+    pool.spawn = record_spawn
+    stop = threading.Event()
+    thread = threading.Thread(target=pool.run, args=(stop,))
+    thread.start()
+    try:
+        assert wait_for(lambda: len(spawned) >= 6, timeout=10)
+    finally:
+        stop.set()
+        thread.join()
+
+    gaps = [later - earlier for earlier, later in zip(spawned, spawned[1:])]
+    # Each gap is the process lifetime plus the backoff delay: 0.1, 0.2, 0.4, then capped at 0.4
+    for attempt, gap in enumerate(gaps):
+        assert gap >= min(0.1 * 2**attempt, 0.4)
+    assert gaps[0] < gaps[1] < gaps[2]
+    assert gaps[-1] < 0.4 + 0.5
+    assert metrics.snapshot("crash")["restarts"] >= 5
@@ -0,0 +1,528 @@
+"""
+Warm pool supervisor that keeps pre-spawned MCP server processes ready for clients.
+
+Starting `npx -y ...` or `docker run ...` takes seconds, so the supervisor spawns each installed
+server ahead of time and hands an already running instance to a client when it attaches. Clients
+reach the supervisor through a proxy entry in their config that runs this module's lightweight
+`attach` entry point. If the supervisor is not running, `attach` execs the original command, so a
+proxied config keeps working on its own.
+
+This module only depends on the standard library so that `attach` starts quickly.
+"""
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+DEFAULT_SOCKET_PATH = os.environ.get(
+    "MCP_MANAGER_POOL_SOCKET", os.path.expanduser("~/.mcp_manager_pool.sock")
+)
+ATTACH_MODULE = "mcp_manager.warm_pool"
+PROXY_SEPARATOR = "--"
+CONNECT_TIMEOUT = 1.0
+
+_CHUNK_SIZE = 65536
+_LATENCY_SAMPLES = 1000
+
+
+class SupervisorStartError(Exception):
+    """Raised when the supervisor can't take over its socket path."""
+
+
+class SupervisorRunningError(SupervisorStartError):
+    """Raised when another supervisor is already serving the socket."""
+
+
+def make_proxy_config(server_name: str, mcp_config: Dict) -> Dict:
+    """
+    Build a client config entry that attaches to the warm pool for a server.
+
+    The original command is kept after a `--` separator so it can be recovered later and used
+    as a cold-start fallback. Other keys of the entry, such as `type`, are kept as they are.
+
+    Args:
+        server_name: Name of the installed server
+        mcp_config: The server's original MCP configuration
+
+    Returns:
+        Proxy MCP configuration dictionary
+    """
+    return {
+        **mcp_config,
+        "command": sys.executable,
+        "args": [
+            "-m",
+            ATTACH_MODULE,
+            "attach",
+            server_name,
+            PROXY_SEPARATOR,
+            mcp_config["command"],
+            *mcp_config.get("args", []),
+        ],
+    }
+
+
+def is_proxy_config(mcp_config: Dict) -> bool:
+    """
+    Check whether a client config entry is a warm pool proxy entry.
+    """
+    args = mcp_config.get("args", [])
+    return len(args) >= 3 and args[:3] == ["-m", ATTACH_MODULE, "attach"]
+
+
+def unwrap_proxy_config(mcp_config: Dict) -> Dict:
+    """
+    Recover the original MCP configuration from a proxy entry.
+
+    Entries that are not proxy entries are returned unchanged.
+    """
+    if not is_proxy_config(mcp_config):
+        return mcp_config
+    args = mcp_config["args"]
+    command = args[args.index(PROXY_SEPARATOR) + 1 :]
+    return {**mcp_config, "command": command[0], "args": command[1:]}
+
+
+class PoolMetrics:
+    """Thread-safe hit-rate and attach-latency counters for each pooled server."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._restarts: Dict[str, int] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def record_attach(self, server_name: str, hit: bool, latency: float) -> None:
+        with self._lock:
+            counter = self._hits if hit else self._misses
+            counter[server_name] = counter.get(server_name, 0) + 1
+            samples = self._latencies.setdefault(server_name, deque(maxlen=_LATENCY_SAMPLES))
+            samples.append(latency)
+
+    def record_restart(self, server_name: str) -> None:
+        with self._lock:
+            self._restarts[server_name] = self._restarts.get(server_name, 0) + 1
+
+    def snapshot(self, server_name: str) -> Dict:
+        """
+        Summarize the metrics for a server.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, restarts and attach latency in milliseconds
+        """
+        with self._lock:
+            hits = self._hits.get(server_name, 0)
+            misses = self._misses.get(server_name, 0)
+            samples = sorted(self._latencies.get(server_name, ()))
+            restarts = self._restarts.get(server_name, 0)
+
+        total = hits + misses
+        latency_ms = {"avg": 0.0, "p50": 0.0, "max": 0.0}
+        if samples:
+            latency_ms = {
+                "avg": sum(samples) / len(samples) * 1000,
+                "p50": samples[len(samples) // 2] * 1000,
+                "max": samples[-1] * 1000,
+            }
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "restarts": restarts,
+            "attach_ms": latency_ms,
+        }
+
+
+class _Instance:
+    def __init__(self, proc: subprocess.Popen):
+        self.proc = proc
+        self.started = time.monotonic()
+
+
+class ServerPool:
+    """
+    Keep a fixed number of idle instances of one server running.
+
+    A background thread replaces instances that are handed out or that exit while idle.
+    Consecutive crashes back off exponentially before the next spawn.
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        mcp_config: Dict,
+        size: int,
+        metrics: PoolMetrics,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        stable_after: float = 5.0,
+        check_interval: float = 0.5,
+    ):
+        self.server_name = server_name
+        self.mcp_config = mcp_config
+        self.size = size
+        self.metrics = metrics
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stable_after = stable_after
+        self.check_interval = check_interval
+        self._idle: Deque[_Instance] = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._failures = 0
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def spawn(self) -> subprocess.Popen:
+        """
+        Start a new instance of the server with piped stdio.
+        """
+        env = dict(os.environ)
+        env.update(self.mcp_config.get("env") or {})
+        return subprocess.Popen(
+            [self.mcp_config["command"], *self.mcp_config.get("args", [])],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+
+    def take(self) -> Tuple[subprocess.Popen, bool]:
+        """
+        Hand out a running instance, spawning one on demand if the pool is empty.
+
+        Returns:
+            Tuple of (process: Popen, hit: bool)
+        """
+        proc = None
+        with self._lock:
+            while self._idle and proc is None:
+                instance = self._idle.popleft()
+                if instance.proc.poll() is None:
+                    proc = instance.proc
+        self._wake.set()
+        if proc is not None:
+            return proc, True
+        return self.spawn(), False
+
+    def run(self, stop: threading.Event) -> None:
+        """
+        Replenish the pool until `stop` is set, then terminate idle instances.
+        """
+        while not stop.is_set():
+            crashed = self._reap()
+            if crashed:
+                self._failures += 1
+            elif self._is_stable():
+                self._failures = 0
+
+            if self._failures:
+                delay = min(self.backoff_base * 2 ** (self._failures - 1), self.backoff_max)
+                if stop.wait(delay):
+                    break
+
+            while self.idle_count < self.size and not stop.is_set():
+                try:
+                    instance = _Instance(self.spawn())
+                except OSError:
+                    self._failures += 1
+                    break
+                with self._lock:
+                    self._idle.append(instance)
+
+            self._wake.wait(self.check_interval)
+            self._wake.clear()
+
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for instance in idle:
+            _terminate(instance.proc)
+
+    def _reap(self) -> int:
+        with self._lock:
+            alive = deque(i for i in self._idle if i.proc.poll() is None)
+            crashed = len(self._idle) - len(alive)
+            self._idle = alive
+        for _ in range(crashed):
+            self.metrics.record_restart(self.server_name)
+        return crashed
+
+    def _is_stable(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            return len(self._idle) >= self.size and all(
+                now - i.started >= self.stable_after for i in self._idle
+            )
+
+
+class Supervisor:
+    """
+    Serve warm instances of several servers over a Unix socket.
+
+    Each connection sends one JSON request line. `{"op": "attach", "server": name}` is answered
+    with `{"ok": true, "hit": bool}` and the connection then carries the instance's stdio;
+    `{"op": "stats"}` is answered with the metrics for every pooled server.
+    """
+
+    def __init__(
+        self,
+        servers: Dict[str, Dict],
+        size: int = 1,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        **pool_options,
+    ):
+        self.socket_path = socket_path
+        self.metrics = PoolMetrics()
+        self.pools = {
+            name: ServerPool(name, mcp_config, size, self.metrics, **pool_options)
+            for name, mcp_config in servers.items()
+        }
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._listener: Optional[socket.socket] = None
+
+    def start(self) -> None:
+        """
+        Start the replenish threads and bind the socket.
+
+        Raises:
+            SupervisorRunningError: If another supervisor is already serving the socket
+            SupervisorStartError: If the socket path can't be used
+        """
+        try:
+            self._remove_stale_socket()
+            listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                listener.bind(self.socket_path)
+                listener.listen()
+            except OSError:
+                listener.close()
+                raise
+        except SupervisorStartError:
+            raise
+        except OSError as e:
+            raise SupervisorStartError(f"Can't use warm pool socket {self.socket_path}: {e}") from e
+        self._listener = listener
+        for pool in self.pools.values():
+            thread = threading.Thread(target=pool.run, args=(self._stop,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _remove_stale_socket(self) -> None:
+        try:
+            mode = os.stat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise SupervisorStartError(f"Warm pool socket path {self.socket_path} is not a socket")
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(CONNECT_TIMEOUT)
+        try:
+            probe.connect(self.socket_path)
+        except ConnectionRefusedError:
+            # Stale socket left behind by a supervisor that didn't shut down cleanly
+            os.unlink(self.socket_path)
+        except socket.timeout as e:
+            raise SupervisorRunningError(f"Warm pool already running at {self.socket_path}") from e
+        else:
+            raise SupervisorRunningError(f"Warm pool already running at {self.socket_path}")
+        finally:
+            probe.close()
+
+    def serve_forever(self) -> None:
+        """
+        Accept client connections until `stop` is called.
+        """
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._listener is not None:
+            self._listener.close()
+            # Only remove the socket we bound, never another supervisor's
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        for pool in self.pools.values():
+            pool._wake.set()
+        for thread in self._threads:
+            thread.join()
+
+    def stats(self) -> Dict[str, Dict]:
+        stats = {}
+        for name, pool in self.pools.items():
+            stats[name] = self.metrics.snapshot(name)
+            stats[name]["idle"] = pool.idle_count
+        return stats
+
+    def _handle(self, conn: socket.socket) -> None:
+        started = time.monotonic()
+        with conn:
+            reader = conn.makefile("rb")
+            line = reader.readline()
+            if not line:
+                # Liveness probe from another supervisor's `start`
+                return
+            try:
+                request = json.loads(line)
+            except ValueError:
+                _send_json(conn, {"ok": False, "error": "Invalid request"})
+                return
+
+            if request.get("op") == "stats":
+                _send_json(conn, {"ok": True, "servers": self.stats()})
+                return
+
+            server_name = request.get("server")
+            pool = self.pools.get(server_name)
+            if request.get("op") != "attach" or pool is None:
+                _send_json(conn, {"ok": False, "error": f"Server not pooled: {server_name}"})
+                return
+
+            try:
+                proc, hit = pool.take()
+            except OSError as e:
+                _send_json(conn, {"ok": False, "error": str(e)})
+                return
+            self.metrics.record_attach(server_name, hit, time.monotonic() - started)
+            _send_json(conn, {"ok": True, "hit": hit})
+            _relay(reader, conn, proc)
+
+
+def _send_json(conn: socket.socket, message: Dict) -> None:
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _pump(read: Callable[[int], bytes], write: Callable[[bytes], None]) -> None:
+    try:
+        while True:
+            chunk = read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            write(chunk)
+    except (OSError, ValueError):
+        pass
+
+
+def _write_flush(stream) -> Callable[[bytes], None]:
+    def write(chunk: bytes) -> None:
+        stream.write(chunk)
+        stream.flush()
+
+    return write
+
+
+def _terminate(proc: subprocess.Popen, timeout: float = 5.0) -> None:
+    if proc.stdin:
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+    try:
+        proc.wait(timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _relay(reader, conn: socket.socket, proc: subprocess.Popen) -> None:
+    def upstream() -> None:
+        _pump(reader.read1, _write_flush(proc.stdin))
+        _terminate(proc)
+
+    thread = threading.Thread(target=upstream, daemon=True)
+    thread.start()
+    _pump(proc.stdout.read1, conn.sendall)
+    try:
+        conn.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    thread.join()
+
+
+def _connect(request: Dict, socket_path: str) -> Tuple[socket.socket, object, Dict]:
+    # Bound the handshake so a wedged supervisor can't hang the client; relaying has no timeout
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(CONNECT_TIMEOUT)
+    try:
+        conn.connect(socket_path)
+        _send_json(conn, request)
+        reader = conn.makefile("rb")
+        response = json.loads(reader.readline())
+        conn.settimeout(None)
+        return conn, reader, response
+    except (OSError, ValueError):
+        conn.close()
+        raise
+
+
+def request_stats(socket_path: str = DEFAULT_SOCKET_PATH) -> Optional[Dict[str, Dict]]:
+    """
+    Fetch pool metrics from a running supervisor.
+
+    Returns:
+        Metrics per server, or None if no supervisor is reachable
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        conn, _, response = _connect({"op": "stats"}, socket_path)
+    except (OSError, ValueError):
+        return None
+    conn.close()
+    return response.get("servers")
+
+
+def attach(server_name: str, fallback: List[str], socket_path: str = DEFAULT_SOCKET_PATH) -> None:
+    """
+    Connect this process's stdio to a warm instance, or exec `fallback` if none is available.
+    """
+    response = None
+    if hasattr(socket, "AF_UNIX"):
+        try:
+            conn, reader, response = _connect({"op": "attach", "server": server_name}, socket_path)
+        except (OSError, ValueError):
+            response = None
+        if response is not None and not response.get("ok"):
+            conn.close()
+
+    if not response or not response.get("ok"):
+        os.execvp(fallback[0], fallback)
+
+    def upstream() -> None:
+        _pump(sys.stdin.buffer.read1, conn.sendall)
+        try:
+            conn.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+    threading.Thread(target=upstream, daemon=True).start()
+    _pump(reader.read1, _write_flush(sys.stdout.buffer))
+    conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 4 or argv[0] != "attach" or PROXY_SEPARATOR not in argv:
+        sys.exit(f"usage: python -m {ATTACH_MODULE} attach <server> -- <command> [args...]")
+    separator = argv.index(PROXY_SEPARATOR)
+    attach(argv[1], argv[separator + 1 :])
+
+
+if __name__ == "__main__":
+    main()